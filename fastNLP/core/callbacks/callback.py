@@ -8,6 +8,36 @@ from typing import Callable, Dict, Optional
 from .callback_event import Event, Filter
 
 
+# 所有的 callback 时机的名称，其在该元组中的位置即为其在 ``Callback._implemented_events`` 掩码中对应的比特位；
+_EVENT_NAMES = (
+    'on_after_trainer_initialized',
+    'on_sanity_check_begin',
+    'on_sanity_check_end',
+    'on_train_begin',
+    'on_train_end',
+    'on_train_epoch_begin',
+    'on_train_epoch_end',
+    'on_fetch_data_begin',
+    'on_fetch_data_end',
+    'on_train_batch_begin',
+    'on_train_batch_end',
+    'on_exception',
+    'on_save_model',
+    'on_load_model',
+    'on_save_checkpoint',
+    'on_load_checkpoint',
+    'on_before_backward',
+    'on_after_backward',
+    'on_before_optimizers_step',
+    'on_after_optimizers_step',
+    'on_before_zero_grad',
+    'on_after_zero_grad',
+    'on_evaluate_begin',
+    'on_evaluate_end',
+)
+_EVENT_INDEX = {name: idx for idx, name in enumerate(_EVENT_NAMES)}
+
+
 class Callback:
     r"""
     实际使用的 callback 类，不管是 **fastNLP** 默认提供的一些 callback 实例，还是用户自己定制的 callback 类，都应该继承该基类；
@@ -45,6 +75,18 @@ class Callback:
     **on_load_model(trainer)** / **on_save_checkpoint(trainer)** / **on_load_checkpoint(trainer)** 将根据需要在 :meth:`Trainer.run <fastNLP.core.controllers.Trainer.run>` 
     中特定的时间调用。
     """
+    __slots__ = ()
+
+    # 用一个整数掩码记录该类重写了哪些 callback 函数，第 i 位对应 ``_EVENT_NAMES[i]``；基类中的 callback 函数均为空实现，因此为 0；
+    _implemented_events: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        mask = 0
+        for idx, name in enumerate(_EVENT_NAMES):
+            if getattr(cls, name) is not getattr(Callback, name):
+                mask |= 1 << idx
+        cls._implemented_events = mask
 
     def on_after_trainer_initialized(self, trainer, driver):
         r"""
@@ -291,6 +333,7 @@ class _CallbackWrapper(Callback):
         if isinstance(event, Event):
             _filter = Filter(event.every, event.once, event.filter_fn)
             setattr(self, event.value, _filter(fn))
+            self._implemented_events = 1 << _EVENT_INDEX[event.value]
 
     @property
     def callback_name(self):
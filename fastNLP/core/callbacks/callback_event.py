@@ -429,6 +429,9 @@ class Event:
         return Event(value='on_evaluate_end', every=every, once=once, filter_fn=filter_fn)
 
 
+_check_filter_legality = check_legality(lambda *args, **kwargs: ...)
+
+
 class Filter:
     r"""
     可以控制一个函数实际的运行频率的函数修饰器。
@@ -438,21 +441,25 @@ class Filter:
     :param filter_fn: 用户定制的频率控制函数；注意该函数内部的频率判断应当是无状态的，除了参数 `self.num_called` 和
         `self.num_executed` 外，因为我们会在预跑后重置这两个参数的状态；
     """
+    __slots__ = ('num_called', 'num_executed', '_every', '_once', '_filter')
+
     def __init__(self, every: Optional[int] = None, once: Optional[int] = None, filter_fn: Optional[Callable] = None):
         # check legality
-        check_legality(lambda *args,**kwargs:...)(every, once, filter_fn)
+        _check_filter_legality(every, once, filter_fn)
         if (every is None) and (once is None) and (filter_fn is None):
             every = 1
         # 设置变量，包括全局变量；
+        # 注意 num_called 和 num_executed 是每一个 Filter 实例自己的状态，因此即使频率设置相同，不同的函数之间也不能共享同一个 Filter；
         self.num_called = 0
         self.num_executed = 0
 
+        # 这里保存的是类上的函数而不是绑定方法，调用时会显式地传入 self ，因此所有相同类型的 Filter 共享同一个判断函数；
         if every is not None:
             self._every = every
-            self._filter = self.every_filter
+            self._filter = Filter.every_filter
         elif once is not None:
             self._once = once
-            self._filter = self.once_filter
+            self._filter = Filter.once_filter
         else:
             self._filter = filter_fn
 
@@ -1,9 +1,8 @@
-import inspect
 from typing import List, Optional, Dict, Sequence
 from collections import defaultdict
 
 from .callback_event import Event
-from .callback import Callback
+from .callback import Callback, _EVENT_INDEX
 from fastNLP.core.log import logger
 from .progress_callback import ProgressCallback, choose_progress_callback
 from ..utils.exceptions import EarlyStopException
@@ -122,10 +121,12 @@ class CallbackManager:
         :param callback: 一个具体的 callback 实例；
         """
         self.all_callbacks.append(callback)
+        instance_attrs = getattr(callback, '__dict__', ())
         for name, member in Event.__dict__.items():
             if isinstance(member, staticmethod):
-                _fn = getattr(callback, name)
-                if inspect.getsource(_fn) != inspect.getsource(getattr(Callback, name)):
+                # 只有被重写过的 callback 函数才会加入，从而避免在训练过程中调用大量的空函数；直接赋值在实例上的 callback 函数同样会被加入；
+                if callback._implemented_events & (1 << _EVENT_INDEX[name]) or name in instance_attrs:
+                    _fn = getattr(callback, name)
                     self.callback_fns[name].append(_fn)
                     self.extract_callback_filter_state(callback.callback_name, _fn)
 
@@ -8,11 +8,17 @@ from typing import Dict, Union, Any
 from abc import ABC
 import functools
 
+import numpy as np
+
 from fastNLP.core.utils import apply_to_collection
 from fastNLP.core.callbacks import Callback
 from fastNLP.core.callbacks.utils import _get_monitor_value
 from fastNLP.core.log import logger
 from fastNLP.core.utils.utils import _check_valid_parameters_number
+from fastNLP.envs.imports import _NEED_IMPORT_TORCH
+
+if _NEED_IMPORT_TORCH:
+    import torch
 
 
 class CanItemDataType(ABC):
@@ -24,6 +30,51 @@ class CanItemDataType(ABC):
         return NotImplemented
 
 
+# 评测结果中最常见的可以调用 item() 的类型，直接使用 isinstance 判断而不需要经过 CanItemDataType 的 __subclasshook__ ；
+_ITEM_FAST_TYPES = (np.ndarray, np.generic) + ((torch.Tensor, ) if _NEED_IMPORT_TORCH else ())
+_PY_SCALAR_TYPES = frozenset((int, float, bool, str, type(None)))
+
+
+def _itemize(data):
+    """
+    对 ``dict`` / ``list`` / ``tuple`` 进行递归，将其中的 Tensor 等类型调用 item() 转为 python 内置类型；其它类型交给
+    :func:`apply_to_collection` 处理。
+
+    :param data:
+    :return:
+    """
+    elem_type = type(data)
+    if elem_type in _PY_SCALAR_TYPES:
+        return data
+    if isinstance(data, _ITEM_FAST_TYPES):
+        return data.item()
+    if elem_type is dict:
+        return {k: _itemize(v) for k, v in data.items()}
+    if elem_type is list or elem_type is tuple:
+        return elem_type(_itemize(d) for d in data)
+    return apply_to_collection(data, dtype=CanItemDataType, function=lambda x: x.item())
+
+
+def _needs_item(data) -> bool:
+    """
+    检查 ``data`` 中是否存在 python 内置标量以外的数据，即是否需要调用 :func:`_itemize` 进行转换。对于无法确定的类型也会返回 ``True`` 。
+
+    :param data:
+    :return:
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        elem_type = type(obj)
+        if elem_type is dict:
+            stack.extend(obj.values())
+        elif elem_type is list or elem_type is tuple:
+            stack.extend(obj)
+        elif elem_type not in _PY_SCALAR_TYPES:
+            return True
+    return False
+
+
 class ResultsMonitor:
     """
     可用于监控某个数值，并通过 :meth:`is_better_results` 等接口检测结果是否变得更好。
@@ -40,6 +91,8 @@ class ResultsMonitor:
          的 ``monitor`` 值请返回 ``None`` ；
     :param larger_better: monitor 是否为越大越好；
     """
+    __slots__ = ('monitor', 'larger_better', 'monitor_value', '_real_monitor', '_monitor_sign', '_log_name')
+
     def __init__(self, monitor:Union[Callback, str], larger_better:bool=True):
         self.set_monitor(monitor, larger_better)
         self._log_name = self.__class__.__name__
@@ -52,10 +105,9 @@ class ResultsMonitor:
             self.monitor = str(monitor) if monitor is not None else None
         if self.monitor is not None:
             self.larger_better = bool(larger_better)
-        if larger_better:
-            self.monitor_value = float('-inf')
-        else:
-            self.monitor_value = float('inf')
+        # 越大越好时为 1.0 ，否则为 -1.0 ；比较时统一乘上该符号后按照越大越好比较，避免每次比较时的分支判断；
+        self._monitor_sign = 1.0 if larger_better else -1.0
+        self.monitor_value = -self._monitor_sign * float('inf')
         self._real_monitor = self.monitor
 
     def itemize_results(self, results):
@@ -65,7 +117,7 @@ class ResultsMonitor:
         :param results:
         :return:
         """
-        return apply_to_collection(results, dtype=CanItemDataType, function=lambda x: x.item())
+        return _itemize(results)
 
     def get_monitor_value(self, results:Dict)->Union[float, None]:
         """
@@ -76,13 +128,21 @@ class ResultsMonitor:
         """
         if len(results) == 0 or self.monitor is None:
             return None
-        # 保证所有的 tensor 都被转换为了 python 特定的类型
-        results = self.itemize_results(results)
+        if callable(self.monitor):
+            # 自定义的 monitor 函数会拿到全部的结果，因此需要保证所有的 tensor 都被转换为了 python 特定的类型；如果已经全部是 python
+            #  内置类型则不需要再复制一遍
+            if _needs_item(results):
+                results = self.itemize_results(results)
+        # 最常见的情况：monitor 与上一次使用的一致并且直接存在于结果中，此时不需要进行匹配，也不会有任何需要提示的信息
+        elif self._real_monitor == self.monitor and self.monitor in results:
+            return _itemize(results[self.monitor])
         use_monitor, monitor_value = _get_monitor_value(monitor=self.monitor,
                                                         real_monitor=self._real_monitor,
                                                         res=results)
         if monitor_value is None:
             return monitor_value
+        # 通过名称匹配时只会用到 key ，因此只需要对最终找到的那个值进行转换
+        monitor_value = _itemize(monitor_value)
         # 第一次运行
         if isinstance(self.monitor, str) and self._real_monitor == self.monitor and use_monitor != self.monitor:
             logger.rank_zero_warning(f"We can not find monitor:`{self.monitor}` for `{self.log_name}` in the "
@@ -140,11 +200,7 @@ class ResultsMonitor:
             return False
         if monitor_value2 is None:
             return True
-        better = False
-        if (self.larger_better and monitor_value1 > monitor_value2) or \
-                (not self.larger_better and monitor_value1 < monitor_value2):
-            better = True
-        return better
+        return monitor_value1 * self._monitor_sign > monitor_value2 * self._monitor_sign
 
     @property
     def monitor_name(self):
@@ -200,6 +256,8 @@ class HasMonitorCallback(ResultsMonitor, Callback):
     :param larger_better: monitor 是否为越大越好；
     :param must_have_monitor: 这个 callback 是否必须有 monitor 设置。如果设置为 ``True`` ，且没检测到设置 monitor 会报错；
     """
+    __slots__ = ('must_have_monitor', )
+
     def __init__(self, monitor, larger_better, must_have_monitor=False):
         super().__init__(monitor, larger_better)
         self.must_have_monitor = must_have_monitor
@@ -89,6 +89,25 @@ class TestFilter:
                 _res.append(cu_res)
         assert _res == [w - 1 for w in range(60, 101, 10)]
 
+    def test_filter_not_share_state(self):
+        # 相同频率的两个 Filter 不应当共享调用次数
+        @Filter(every=2)
+        def _fn1(data):
+            return data
+
+        @Filter(every=2)
+        def _fn2(data):
+            return data
+
+        _res1, _res2 = [], []
+        for i in range(10):
+            _res1.append(_fn1(i))
+            if i % 2 == 0:
+                _res2.append(_fn2(i))
+        assert _res1 == [None, 1, None, 3, None, 5, None, 7, None, 9]
+        assert _res2 == [None, 2, None, 6, None]
+        assert _fn1.__fastNLP_filter__.num_called == 10 and _fn2.__fastNLP_filter__.num_called == 5
+
 
 @pytest.mark.torch
 def test_filter_fn_torch():
@@ -0,0 +1,70 @@
+import copy
+
+from fastNLP.core.callbacks import Callback, Event
+from fastNLP.core.callbacks.callback import _CallbackWrapper
+from fastNLP.core.callbacks.callback_manager import CallbackManager
+
+
+class _TrainBeginCallback(Callback):
+    def on_train_begin(self, trainer):
+        pass
+
+
+class _SubTrainBeginCallback(_TrainBeginCallback):
+    def on_evaluate_end(self, trainer, results):
+        pass
+
+
+class TestDissectCallback:
+    def test_only_implemented_events(self):
+        manager = CallbackManager([_TrainBeginCallback(), _SubTrainBeginCallback()])
+        manager.initialize_class_callbacks()
+
+        assert len(manager.callback_fns['on_train_begin']) == 2
+        assert len(manager.callback_fns['on_evaluate_end']) == 1
+        assert len(manager.callback_fns['on_fetch_data_begin']) == 0
+        assert len(manager.callback_fns['on_train_batch_begin']) == 0
+
+    def test_instance_assigned_event(self):
+        def _fn(trainer):
+            pass
+
+        callback = _TrainBeginCallback()
+        callback.on_fetch_data_begin = _fn
+        manager = CallbackManager([callback])
+        manager.initialize_class_callbacks()
+
+        assert manager.callback_fns['on_fetch_data_begin'] == [_fn]
+        assert len(manager.callback_fns['on_train_begin']) == 1
+
+    def test_callback_wrapper(self):
+        def _fn(trainer):
+            pass
+
+        manager = CallbackManager([])
+        manager.dissect_one_callback(_CallbackWrapper(Event.on_train_begin(every=2), _fn))
+
+        assert len(manager.callback_fns['on_train_begin']) == 1
+        assert sum(len(fns) for fns in manager.callback_fns.values()) == 1
+        assert len(manager._callback_filters) == 1
+
+    def test_callback_wrapper_not_share_filter(self):
+        def _fn(trainer):
+            pass
+
+        wrapper_1 = _CallbackWrapper(Event.on_train_begin(every=2), _fn)
+        wrapper_2 = _CallbackWrapper(Event.on_train_begin(every=2), _fn)
+        assert 'on_train_begin' in wrapper_1.__dict__
+        assert wrapper_1.callback_name == '_fn'
+
+        wrapper_1.on_train_begin(None)
+        assert wrapper_1.on_train_begin.__fastNLP_filter__.num_called == 1
+        assert wrapper_2.on_train_begin.__fastNLP_filter__.num_called == 0
+
+    def test_callback_wrapper_deepcopy(self):
+        def _fn(trainer):
+            pass
+
+        wrapper = copy.deepcopy(_CallbackWrapper(Event.on_train_begin(every=2), _fn))
+        assert wrapper.fn is _fn
+        assert wrapper.on_train_begin.__fastNLP_filter__._every == 2
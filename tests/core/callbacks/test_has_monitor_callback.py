@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+
+from fastNLP.core.callbacks.has_monitor_callback import ResultsMonitor, _needs_item
+
+
+class TestResultsMonitor:
+    @pytest.mark.parametrize("larger_better", [True, False])
+    def test_is_former_monitor_value_better(self, larger_better):
+        monitor = ResultsMonitor(monitor='acc', larger_better=larger_better)
+        assert monitor.monitor_value == (float('-inf') if larger_better else float('inf'))
+
+        assert monitor.is_former_monitor_value_better(0.2, 0.1) is larger_better
+        assert monitor.is_former_monitor_value_better(0.1, 0.2) is not larger_better
+        assert monitor.is_former_monitor_value_better(0.1, 0.1) is False
+        assert monitor.is_former_monitor_value_better(None, 0.1) is False
+        assert monitor.is_former_monitor_value_better(0.1, None) is True
+
+    def test_is_better_results(self):
+        monitor = ResultsMonitor(monitor='acc', larger_better=False)
+        assert monitor.is_better_results({'acc': 0.5})
+        assert not monitor.is_better_results({'acc': 0.6})
+        assert monitor.is_better_results({'acc': 0.4})
+        assert monitor.monitor_value == 0.4
+
+        monitor.set_monitor('acc', larger_better=True)
+        assert monitor.is_better_results({'acc': 0.1})
+        assert not monitor.is_better_results({'acc': 0.05})
+
+    def test_itemize_results(self):
+        monitor = ResultsMonitor(monitor='acc', larger_better=True)
+        results = {'acc': np.float32(0.5), 'f': [np.array(1), (np.int64(2), 3.0)], 'name': 'abc'}
+        res = monitor.itemize_results(results)
+        assert res == {'acc': 0.5, 'f': [1, (2, 3.0)], 'name': 'abc'}
+        assert type(res['acc']) is float and type(res['f'][0]) is int and type(res['f'][1]) is tuple
+
+    def test_needs_item(self):
+        assert not _needs_item({'acc': 0.5, 'f': [1, (2, 3.0)], 'name': 'abc', 'none': None})
+        assert _needs_item({'acc': 0.5, 'f': [1, (np.int64(2), 3.0)]})
+        assert _needs_item({'acc': np.array(0.5)})
+
+        monitor = ResultsMonitor(monitor='acc', larger_better=True)
+        assert monitor.get_monitor_value({'acc': np.float32(0.5), 'f': 0.1}) == 0.5
+
+    def test_get_monitor_value(self):
+        monitor = ResultsMonitor(monitor='f1', larger_better=True)
+        assert monitor.get_monitor_value({'f1': 0.2, 'acc': 0.3}) == 0.2
+        assert monitor._real_monitor == 'f1'
+
+        # monitor 匹配不上时使用最相近的 key ，之后一直沿用该 key
+        assert monitor.get_monitor_value({'acc#f1': 0.4, 'acc': 0.3}) == 0.4
+        assert monitor._real_monitor == 'acc#f1'
+        assert monitor.get_monitor_value({'acc#f1': 0.5, 'acc': 0.3}) == 0.5
+        # monitor 重新出现时优先使用 monitor
+        assert monitor.get_monitor_value({'acc#f1': 0.5, 'f1': 0.6}) == 0.6
+        assert monitor._real_monitor == 'f1'
+
+        monitor.set_monitor('acc', larger_better=True)
+        assert monitor._real_monitor == 'acc'
+        assert monitor.get_monitor_value({'f1': 0.2, 'acc': 0.3}) == 0.3
+
+    def test_get_monitor_value_not_modify_results(self):
+        results = {'acc#f1': np.float32(0.5), 'f': [np.array(1)]}
+        monitor = ResultsMonitor(monitor='f1', larger_better=True)
+        value = monitor.get_monitor_value(results)
+        assert value == 0.5 and type(value) is float
+        value = monitor.get_monitor_value(results)
+        assert value == 0.5 and type(value) is float
+        assert type(results['acc#f1']) is np.float32 and type(results['f'][0]) is np.ndarray
+
+        monitor = ResultsMonitor(monitor=lambda results: results['f'][0], larger_better=True)
+        value = monitor.get_monitor_value(results)
+        assert value == 1 and type(value) is int
+        assert type(results['f'][0]) is np.ndarray